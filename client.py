@@ -4,22 +4,41 @@ CLI Omok Game Client
 Connects to server, displays UI, and handles user input
 """
 
+import base64
 import socket
+import struct
 import threading
 import json
+import queue
 import sys
 import time
 import os
 from typing import Dict, List, Optional
 
-from rich.console import Console
+import numpy as np
+from rich.console import Console, Group
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
+from rich.style import Style
 from rich.text import Text
 from rich.layout import Layout
 from rich import box
 import keyboard
 
+# Prefer orjson for the message hot path: loads accepts bytes directly and
+# dumps returns bytes, skipping the extra encode step. Fall back to stdlib.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
 # Load configuration
 try:
     with open('config.json', 'r', encoding='utf-8') as f:
@@ -40,8 +59,36 @@ CURSOR_COLOR = config['ui']['cursor_color']
 BLACK_COLOR = config['ui']['black_color']
 WHITE_COLOR = config['ui']['white_color']
 
+# Wire format: 4-byte big-endian length prefix, then one JSON payload
+_FRAME_HEADER = struct.Struct('>I')
+FRAME_HEADER_SIZE = _FRAME_HEADER.size
+
 console = Console()
 
+# Styles parsed once so panel rendering never hits Rich's markup parser
+BLACK_STYLE = Style.parse(BLACK_COLOR)
+WHITE_STYLE = Style.parse(WHITE_COLOR)
+MY_TURN_STYLE = Style.parse("green")
+OPP_TURN_STYLE = Style.parse("yellow")
+STATUS_STYLE = Style.parse("cyan")
+ERROR_STYLE = Style.parse("red")
+HINT_STYLE = Style.parse("dim")
+
+# Static board chrome, computed once: column header (A-O) and row labels
+BOARD_HEADER = "   " + " ".join(chr(65 + i) for i in range(BOARD_SIZE))
+ROW_LABELS = tuple(f"\n{y + 1:2d} " for y in range(BOARD_SIZE))
+
+# Prebuilt styled cell renderables keyed by (stone, cursor_here); appending
+# these skips Rich's markup parser entirely on the render hot path
+CELL_TEXTS = {
+    (0, False): Text(f"{EMPTY} "),
+    (1, False): Text(f"{BLACK_STONE} ", style=BLACK_COLOR),
+    (2, False): Text(f"{WHITE_STONE} ", style=WHITE_COLOR),
+    (0, True): Text(f"{EMPTY} ", style=f"black on {CURSOR_COLOR}"),
+    (1, True): Text(f"{BLACK_STONE} ", style=f"{BLACK_COLOR} on {CURSOR_COLOR}"),
+    (2, True): Text(f"{WHITE_STONE} ", style=f"{WHITE_COLOR} on {CURSOR_COLOR}"),
+}
+
 
 class GameClient:
     """Game client handling connection, state, and UI"""
@@ -58,8 +105,8 @@ class GameClient:
         self.room_name: Optional[str] = None
         self.my_color: Optional[str] = None
 
-        # Game state
-        self.board = [[0 for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        # Game state (contiguous uint8 array; updated from server messages)
+        self.board = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=np.uint8)
         self.current_turn: Optional[str] = None
         self.black_player: Optional[str] = None
         self.white_player: Optional[str] = None
@@ -74,18 +121,60 @@ class GameClient:
         self.status_message = ""
         self.error_message = ""
 
+        # Redraw signal; set whenever displayed state changes so the
+        # render loop can sleep instead of polling
+        self._need_render = threading.Event()
+        self._need_render.set()
+
+        # Active Live display, if any — the input thread suspends it
+        # while a blocking prompt needs the real screen
+        self._live: Optional[Live] = None
+
+        # O(1) message dispatch: msg_type -> bound handler
+        self._handlers = {
+            'nickname_set': self._on_nickname_set,
+            'room_created': self._on_room_created,
+            'room_list': self._on_room_list,
+            'room_joined': self._on_room_joined,
+            'game_started': self._on_game_started,
+            'game_start_state': self._on_game_start_state,
+            'game_state': self._on_game_state,
+            'move_result': self._on_move_result,
+            'game_over': self._on_game_over,
+            'player_left': self._on_player_left,
+            'error': self._on_error,
+        }
+
         # Threading
         self.receive_thread: Optional[threading.Thread] = None
+        self.send_thread: Optional[threading.Thread] = None
         self.ui_lock = threading.Lock()
 
-        # Message buffer for handling multiple messages
-        self.message_buffer = ""
+        # Outbound frames; drained and batched by the writer thread
+        self._txq: queue.Queue = queue.Queue()
+
+        # Keyboard events (pushed by keyboard hooks, consumed by input thread)
+        self._kbq: queue.Queue = queue.Queue()
+        self._hooks_registered = False
+
+        # Persistent receive buffer so recv doesn't allocate per call; frames
+        # are length-prefixed so each read is exactly one header or payload
+        self._rxbuf = bytearray(65536)
+        self._rxview = memoryview(self._rxbuf)
 
     def connect_to_server(self) -> bool:
         """Connect to game server"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Disable Nagle so small interactive messages (moves) go out
+            # immediately, and grow the kernel buffers for state bursts
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 262144)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)
             self.socket.connect((SERVER_ADDRESS, SERVER_PORT))
+            # Short timeout so the receive thread wakes up to notice
+            # shutdown instead of blocking in recv forever
+            self.socket.settimeout(0.5)
             self.connected = True
 
             # Start receive thread
@@ -93,38 +182,62 @@ class GameClient:
             self.receive_thread.daemon = True
             self.receive_thread.start()
 
+            # Start writer thread
+            self.send_thread = threading.Thread(target=self.send_messages)
+            self.send_thread.daemon = True
+            self.send_thread.start()
+
             return True
         except Exception as e:
             console.print(f"[red]Failed to connect to server: {e}[/red]")
             return False
 
+    def _recv_exact(self, n: int) -> Optional[bytes]:
+        """Read exactly n bytes from the socket. Returns None on EOF."""
+        if n > len(self._rxbuf):
+            self._rxbuf = bytearray(n)
+            self._rxview = memoryview(self._rxbuf)
+
+        view = self._rxview
+        got = 0
+        while got < n:
+            try:
+                r = self.socket.recv_into(view[got:n])
+            except socket.timeout:
+                # Periodic wakeup; bail out if the client is shutting down
+                if not (self.running and self.connected):
+                    return None
+                continue
+            if not r:
+                return None
+            got += r
+        return bytes(view[:n])
+
     def receive_messages(self):
-        """Receive messages from server (runs in separate thread)"""
+        """Receive messages from server (runs in separate thread)
+
+        The wire format is a 4-byte big-endian length prefix followed by
+        one JSON payload, so framing needs no buffer scanning at all.
+        """
         try:
             while self.connected and self.running:
-                data = self.socket.recv(4096)
-                if not data:
+                header = self._recv_exact(FRAME_HEADER_SIZE)
+                if header is None:
                     break
+                size = _FRAME_HEADER.unpack(header)[0]
 
-                # Append received data to buffer
-                self.message_buffer += data.decode('utf-8')
-
-                # Process all complete messages (separated by newlines)
-                while '\n' in self.message_buffer:
-                    # Split on first newline
-                    line, self.message_buffer = self.message_buffer.split('\n', 1)
+                payload = self._recv_exact(size)
+                if payload is None:
+                    break
 
-                    # Skip empty lines
-                    if not line.strip():
-                        continue
-
-                    try:
-                        message = json.loads(line)
-                        self.handle_message(message)
-                    except json.JSONDecodeError as e:
-                        print(f"JSON decode error: {e} | Data: {line[:100]}")
-                    except Exception as e:
-                        print(f"Error handling message: {e}")
+                try:
+                    message = json_loads(payload)
+                    self.handle_message(message)
+                except ValueError as e:
+                    # Covers both json.JSONDecodeError and orjson.JSONDecodeError
+                    print(f"JSON decode error: {e} | Data: {payload[:100]}")
+                except Exception as e:
+                    print(f"Error handling message: {e}")
 
         except Exception as e:
             if self.running:
@@ -134,76 +247,143 @@ class GameClient:
 
     def handle_message(self, message: Dict):
         """Handle incoming messages from server"""
-        msg_type = message.get('type')
-        msg_data = message.get('data', {})
+        handler = self._handlers.get(message.get('type'))
+        if handler is None:
+            return
 
         with self.ui_lock:
-            if msg_type == 'nickname_set':
-                self.status_message = f"Nickname set to: {msg_data.get('nickname')}"
-                self.current_screen = 'lobby'
-
-            elif msg_type == 'room_created':
-                self.room_id = msg_data.get('room_id')
-                self.status_message = "Room created! Waiting for opponent..."
-
-            elif msg_type == 'room_list':
-                self.rooms = msg_data.get('rooms', [])
-                self.selected_room_index = 0
-
-            elif msg_type == 'room_joined':
-                self.room_id = msg_data.get('room_id')
-                self.room_name = msg_data.get('room_name')
-                self.my_color = msg_data.get('your_color')
-                self.current_screen = 'room'
-                self.status_message = f"Joined room '{self.room_name}' as {self.my_color}"
-
-            elif msg_type == 'game_started':
-                self.black_player = msg_data.get('black_player')
-                self.white_player = msg_data.get('white_player')
-                self.current_screen = 'game'
-                self.status_message = "Game started!"
-
-            elif msg_type == 'game_state':
-                self.board = msg_data.get('board', self.board)
-                self.current_turn = msg_data.get('current_turn')
-                self.black_player = msg_data.get('black_player', self.black_player)
-                self.white_player = msg_data.get('white_player', self.white_player)
-
-            elif msg_type == 'move_result':
-                if msg_data.get('success'):
-                    self.status_message = f"Move made at ({msg_data.get('x')}, {msg_data.get('y')})"
-                else:
-                    self.error_message = "Invalid move"
+            handler(message.get('data', {}))
 
-            elif msg_type == 'game_over':
-                winner = msg_data.get('winner')
-                winner_nick = msg_data.get('winner_nickname')
-                reason = msg_data.get('reason')
+        # Every handled message changes something shown on screen
+        self._need_render.set()
 
-                if reason == 'surrender':
-                    self.status_message = f"Game Over! {winner_nick} wins by surrender"
-                else:
-                    self.status_message = f"Game Over! {winner_nick} wins with 5 in a row!"
+    def _on_nickname_set(self, data: Dict):
+        self.status_message = f"Nickname set to: {data.get('nickname')}"
+        self.current_screen = 'lobby'
 
-                # Transition to result screen
-                self.current_screen = 'result'
+    def _on_room_created(self, data: Dict):
+        self.room_id = data.get('room_id')
+        self.status_message = "Room created! Waiting for opponent..."
 
-            elif msg_type == 'player_left':
-                self.status_message = msg_data.get('message', 'Player left')
-                # Transition to result screen
-                self.current_screen = 'result'
+    def _on_room_list(self, data: Dict):
+        self.rooms = data.get('rooms', [])
+        self.selected_room_index = 0
+
+    def _on_room_joined(self, data: Dict):
+        self.room_id = data.get('room_id')
+        self.room_name = data.get('room_name')
+        self.my_color = data.get('your_color')
+        self.current_screen = 'room'
+        self.status_message = f"Joined room '{self.room_name}' as {self.my_color}"
+
+    def _on_game_started(self, data: Dict):
+        self.black_player = data.get('black_player')
+        self.white_player = data.get('white_player')
+        self.current_screen = 'game'
+        self.status_message = "Game started!"
+
+    def _on_game_start_state(self, data: Dict):
+        # Game start: the board is empty by definition, so the server
+        # only tells us whose turn it is
+        self.board.fill(0)
+        self.current_turn = data.get('current_turn')
+
+    def _on_game_state(self, data: Dict):
+        board_b64 = data.get('board_b64')
+        if board_b64 is not None:
+            # The server ships the board as base64 of the raw bytes —
+            # decode straight into a uint8 array, no per-cell parsing
+            new = np.frombuffer(base64.b64decode(board_b64), dtype=np.uint8)
+            if new.size == self.board.size:
+                # Only write the cells that actually differ — normally a
+                # single stone per move
+                diff = np.flatnonzero(new != self.board.ravel())
+                if diff.size:
+                    self.board.ravel()[diff] = new[diff]
+            else:
+                n = int(new.size ** 0.5)
+                self.board = new.reshape(n, n).copy()
+        self.current_turn = data.get('current_turn')
+        self.black_player = data.get('black_player', self.black_player)
+        self.white_player = data.get('white_player', self.white_player)
+
+    def _on_move_result(self, data: Dict):
+        if data.get('success'):
+            # Apply the single-cell delta locally; the server no longer
+            # rebroadcasts the full board on every move
+            x = data.get('x')
+            y = data.get('y')
+            if x is not None and y is not None:
+                self.board[y, x] = 1 if data.get('color') == 'black' else 2
+            self.current_turn = data.get('current_turn', self.current_turn)
+            self.status_message = f"Move made at ({x}, {y})"
+        else:
+            self.error_message = "Invalid move"
+
+    def _on_game_over(self, data: Dict):
+        winner_nick = data.get('winner_nickname')
+        reason = data.get('reason')
+
+        if reason == 'surrender':
+            self.status_message = f"Game Over! {winner_nick} wins by surrender"
+        else:
+            self.status_message = f"Game Over! {winner_nick} wins with 5 in a row!"
+
+        # Transition to result screen
+        self.current_screen = 'result'
+
+    def _on_player_left(self, data: Dict):
+        self.status_message = data.get('message', 'Player left')
+        # Transition to result screen
+        self.current_screen = 'result'
 
-            elif msg_type == 'error':
-                self.error_message = msg_data.get('message', 'Unknown error')
+    def _on_error(self, data: Dict):
+        self.error_message = data.get('message', 'Unknown error')
+
+    def send_messages(self):
+        """Drain the outbound queue (runs in separate thread)
+
+        Any frames queued while a write was in flight are concatenated
+        into the next sendall, so a burst of small messages becomes a
+        single syscall instead of one per message.
+        """
+        while self.running and self.connected:
+            try:
+                data = self._txq.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            # Batch whatever else is already queued into the same write
+            parts = [data]
+            try:
+                while True:
+                    parts.append(self._txq.get_nowait())
+            except queue.Empty:
+                pass
+
+            data = memoryview(b''.join(parts))
+            sent = 0
+            try:
+                while sent < len(data):
+                    try:
+                        sent += self.socket.send(data[sent:])
+                    except socket.timeout:
+                        # The 0.5 s socket timeout exists so the receive
+                        # thread can poll for shutdown; on the send side a
+                        # timeout is just backpressure — keep pushing the
+                        # same frame so the stream never loses framing
+                        if not (self.running and self.connected):
+                            return
+            except Exception as e:
+                if self.running:
+                    console.print(f"[red]Failed to send message: {e}[/red]")
+                break
 
     def send_message(self, message: Dict):
-        """Send message to server"""
-        try:
-            if self.socket and self.connected:
-                data = json.dumps(message).encode('utf-8')
-                self.socket.sendall(data)
-        except Exception as e:
-            console.print(f"[red]Failed to send message: {e}[/red]")
+        """Queue a message for the writer thread"""
+        if self.socket and self.connected:
+            data = json_dumps(message)
+            self._txq.put(_FRAME_HEADER.pack(len(data)) + data)
 
     def set_nickname(self, nickname: str):
         """Set player nickname"""
@@ -242,83 +422,89 @@ class GameClient:
         """Surrender the game"""
         self.send_message({'type': 'surrender'})
 
-    def render_board(self) -> Panel:
-        """Render the game board"""
-        lines = []
+    def leave_room(self):
+        """Leave the current room and return to the lobby"""
+        self.send_message({'type': 'leave_room'})
+        self.current_screen = 'lobby'
+        self.room_id = None
+        self.room_name = None
+        self.my_color = None
 
+    def render_board(self, board, cx: int, cy: int) -> Panel:
+        """Render the game board from snapshotted state"""
         # Column headers (A-O)
-        header = "   " + " ".join([chr(65 + i) for i in range(BOARD_SIZE)])
-        lines.append(header)
+        board_text = Text(BOARD_HEADER)
+
+        # Hoist lookups out of the 225-iteration loop
+        append = board_text.append
+        append_text = board_text.append_text
+        cells = CELL_TEXTS
 
-        # Board rows
+        # Board rows (cursor cell uses a background color instead of brackets)
         for y in range(BOARD_SIZE):
-            row = f"{y + 1:2d} "
+            append(ROW_LABELS[y])
+            row = board[y]
             for x in range(BOARD_SIZE):
-                stone = self.board[y][x]
-
-                # Check if cursor is here (use background color instead of brackets)
-                if x == self.cursor_x and y == self.cursor_y:
-                    if stone == 0:
-                        row += f"[black on {CURSOR_COLOR}]{EMPTY}[/black on {CURSOR_COLOR}] "
-                    elif stone == 1:
-                        row += f"[{BLACK_COLOR} on {CURSOR_COLOR}]{BLACK_STONE}[/{BLACK_COLOR} on {CURSOR_COLOR}] "
-                    else:
-                        row += f"[{WHITE_COLOR} on {CURSOR_COLOR}]{WHITE_STONE}[/{WHITE_COLOR} on {CURSOR_COLOR}] "
-                else:
-                    if stone == 0:
-                        row += f"{EMPTY} "
-                    elif stone == 1:
-                        row += f"[{BLACK_COLOR}]{BLACK_STONE}[/{BLACK_COLOR}] "
-                    else:
-                        row += f"[{WHITE_COLOR}]{WHITE_STONE}[/{WHITE_COLOR}] "
+                append_text(cells[(int(row[x]), x == cx and y == cy)])
 
-            lines.append(row)
-
-        board_text = "\n".join(lines)
         return Panel(board_text, title="Game Board", border_style="blue")
 
-    def render_game_info(self) -> Panel:
-        """Render game information"""
-        info_lines = []
-        info_lines.append(f"Room: {self.room_name or 'N/A'}")
-        info_lines.append(f"")
-        info_lines.append(f"[{BLACK_COLOR}]{BLACK_STONE}[/{BLACK_COLOR}] Black: {self.black_player or 'N/A'}")
-        info_lines.append(f"[{WHITE_COLOR}]{WHITE_STONE}[/{WHITE_COLOR}] White: {self.white_player or 'N/A'}")
-        info_lines.append(f"")
-
-        if self.current_turn:
-            if self.current_turn == self.my_color:
-                info_lines.append(f"[green]Your turn ({self.my_color})[/green]")
+    def render_game_info(self, room_name, black_player, white_player,
+                         current_turn, my_color, status, error) -> Panel:
+        """Render game information from snapshotted state"""
+        info = Text(f"Room: {room_name or 'N/A'}\n\n")
+        info.append(BLACK_STONE, style=BLACK_STYLE)
+        info.append(f" Black: {black_player or 'N/A'}\n")
+        info.append(WHITE_STONE, style=WHITE_STYLE)
+        info.append(f" White: {white_player or 'N/A'}\n")
+
+        if current_turn:
+            if current_turn == my_color:
+                info.append(f"\nYour turn ({my_color})\n", style=MY_TURN_STYLE)
             else:
-                info_lines.append(f"[yellow]Opponent's turn ({self.current_turn})[/yellow]")
+                info.append(f"\nOpponent's turn ({current_turn})\n", style=OPP_TURN_STYLE)
 
-        if self.status_message:
-            info_lines.append(f"")
-            info_lines.append(f"[cyan]{self.status_message}[/cyan]")
+        if status:
+            info.append("\n")
+            info.append(f"{status}\n", style=STATUS_STYLE)
 
-        if self.error_message:
-            info_lines.append(f"")
-            info_lines.append(f"[red]{self.error_message}[/red]")
+        if error:
+            info.append("\n")
+            info.append(f"{error}\n", style=ERROR_STYLE)
 
-        info_lines.append(f"")
-        info_lines.append(f"[dim]Arrow keys: Move cursor[/dim]")
-        info_lines.append(f"[dim]Enter: Place stone[/dim]")
-        info_lines.append(f"[dim]ESC: Surrender[/dim]")
+        info.append("\n")
+        info.append("Arrow keys: Move cursor\n", style=HINT_STYLE)
+        info.append("Enter: Place stone\n", style=HINT_STYLE)
+        info.append("ESC: Surrender", style=HINT_STYLE)
 
-        info_text = "\n".join(info_lines)
-        return Panel(info_text, title="Game Info", border_style="green")
+        return Panel(info, title="Game Info", border_style="green")
 
-    def render_game_screen(self):
-        """Render the full game screen"""
-        console.clear()
+    def render_game_view(self) -> Group:
+        """Build the game screen renderable
 
+        Snapshots shared state under the lock, then renders from the
+        locals, so the network thread never stalls behind rendering.
+        """
         with self.ui_lock:
-            console.print(self.render_game_info())
-            console.print(self.render_board())
+            # Copy, not alias: the handlers mutate the array in place,
+            # and render_board walks it after the lock is released
+            board = self.board.copy()
+            cx, cy = self.cursor_x, self.cursor_y
+            room_name = self.room_name
+            black_player = self.black_player
+            white_player = self.white_player
+            current_turn = self.current_turn
+            my_color = self.my_color
+            status = self.status_message
+            error = self.error_message
+            # Clear old error now that it has been captured for display
+            self.error_message = ""
 
-            # Clear old messages after display
-            if self.error_message:
-                self.error_message = ""
+        return Group(
+            self.render_game_info(room_name, black_player, white_player,
+                                  current_turn, my_color, status, error),
+            self.render_board(board, cx, cy),
+        )
 
     def render_lobby_screen(self):
         """Render the lobby screen"""
@@ -418,30 +604,24 @@ class GameClient:
                 break
 
     def run_room_waiting(self):
-        """Wait in room for opponent"""
-        while self.current_screen == 'room' and self.running:
-            console.clear()
-            console.print(Panel(
-                f"[cyan]Waiting for opponent in '{self.room_name}'...[/cyan]\n\n"
-                f"You are: [bold]{self.my_color}[/bold]\n\n"
-                f"[dim]Press ESC to leave room[/dim]",
-                title="Room",
-                border_style="yellow"
-            ))
-
-            # Check for ESC key
-            if keyboard.is_pressed('esc'):
-                # Notify server that we're leaving the room
-                self.send_message({'type': 'leave_room'})
-
-                self.current_screen = 'lobby'
-                self.room_id = None
-                self.room_name = None
-                self.my_color = None
-                time.sleep(0.3)  # Debounce
-                break
+        """Wait in room for opponent
+
+        ESC is delivered through the key event queue (see
+        handle_game_input), so this loop only waits for a screen change.
+        """
+        self.register_key_hooks()
 
-            time.sleep(0.5)
+        console.clear()
+        console.print(Panel(
+            f"[cyan]Waiting for opponent in '{self.room_name}'...[/cyan]\n\n"
+            f"You are: [bold]{self.my_color}[/bold]\n\n"
+            f"[dim]Press ESC to leave room[/dim]",
+            title="Room",
+            border_style="yellow"
+        ))
+
+        while self.current_screen == 'room' and self.running:
+            time.sleep(0.2)
 
     def run_result(self):
         """Show game result and wait for user to return to lobby"""
@@ -466,69 +646,137 @@ class GameClient:
         self.room_id = None
         self.room_name = None
         self.my_color = None
-        self.board = [[0 for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        self.board = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=np.uint8)
         self.status_message = ""
 
+    # Key name -> debounce interval (seconds)
+    GAME_KEYS = {
+        'up': 0.15,
+        'down': 0.15,
+        'left': 0.15,
+        'right': 0.15,
+        'enter': 0.3,
+        'esc': 0.3,
+    }
+
+    def register_key_hooks(self):
+        """Register keyboard hooks that feed the input queue (once)"""
+        if self._hooks_registered:
+            return
+        self._hooks_registered = True
+
+        for key in self.GAME_KEYS:
+            keyboard.on_press_key(key, lambda e, k=key: self._kbq.put(k))
+
+        # Start input handler thread
+        input_thread = threading.Thread(target=self.handle_game_input)
+        input_thread.daemon = True
+        input_thread.start()
+
     def handle_game_input(self):
-        """Handle input during game (runs in separate thread)"""
+        """Handle input during game and room screens (runs in separate thread)
+
+        Blocks on the key event queue instead of polling, so it costs
+        nothing while the user idles. Debouncing uses per-key timestamps
+        rather than sleeps, so keystrokes are handled immediately.
+        """
+        last_handled: Dict[str, float] = {}
+
         while self.running:
-            if self.current_screen != 'game':
-                time.sleep(0.1)
+            try:
+                key = self._kbq.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            screen = self.current_screen
+            if screen == 'room':
+                if key == 'esc':
+                    self.leave_room()
                 continue
 
+            if screen != 'game':
+                continue
+
+            now = time.monotonic()
+            if now - last_handled.get(key, 0.0) < self.GAME_KEYS[key]:
+                continue
+            last_handled[key] = now
+
             try:
-                # Arrow keys for cursor movement
-                if keyboard.is_pressed('up'):
+                if key == 'up':
                     with self.ui_lock:
                         self.cursor_y = max(0, self.cursor_y - 1)
-                    time.sleep(0.15)  # Debounce
+                        self._need_render.set()
 
-                elif keyboard.is_pressed('down'):
+                elif key == 'down':
                     with self.ui_lock:
                         self.cursor_y = min(BOARD_SIZE - 1, self.cursor_y + 1)
-                    time.sleep(0.15)
+                        self._need_render.set()
 
-                elif keyboard.is_pressed('left'):
+                elif key == 'left':
                     with self.ui_lock:
                         self.cursor_x = max(0, self.cursor_x - 1)
-                    time.sleep(0.15)
+                        self._need_render.set()
 
-                elif keyboard.is_pressed('right'):
+                elif key == 'right':
                     with self.ui_lock:
                         self.cursor_x = min(BOARD_SIZE - 1, self.cursor_x + 1)
-                    time.sleep(0.15)
+                        self._need_render.set()
 
-                elif keyboard.is_pressed('enter'):
+                elif key == 'enter':
                     with self.ui_lock:
                         if self.current_turn == self.my_color:
                             self.make_move(self.cursor_x, self.cursor_y)
-                    time.sleep(0.3)  # Debounce
 
-                elif keyboard.is_pressed('esc'):
+                elif key == 'esc':
                     with self.ui_lock:
+                        # The Live display owns the alternate screen —
+                        # suspend it or the confirm prompt is invisible
+                        live = self._live
+                        if live is not None:
+                            live.stop()
+
                         # Confirm surrender
                         console.print("\n[red]Are you sure you want to surrender? (y/n)[/red]")
                         confirm = console.input().strip().lower()
                         if confirm == 'y':
                             self.surrender()
-                    time.sleep(0.3)
+
+                        if live is not None:
+                            live.start(refresh=True)
+                        self._need_render.set()
+
+                    # The hooks latched the prompt's keystrokes too —
+                    # notably the Enter that submitted the answer. Drop
+                    # them so they don't replay as game keys
+                    try:
+                        while True:
+                            self._kbq.get_nowait()
+                    except queue.Empty:
+                        pass
 
             except Exception as e:
                 # Ignore keyboard errors
                 pass
 
-            time.sleep(0.05)
-
     def run_game(self):
         """Run game loop"""
-        # Start input handler thread
-        input_thread = threading.Thread(target=self.handle_game_input)
-        input_thread.daemon = True
-        input_thread.start()
+        self.register_key_hooks()
 
-        while self.current_screen == 'game' and self.running:
-            self.render_game_screen()
-            time.sleep(0.1)  # Refresh rate
+        # Live diffs lines on update, so a refresh only writes the cells
+        # that actually changed instead of clearing the whole screen
+        with Live(self.render_game_view(), console=console,
+                  refresh_per_second=20, screen=True) as live:
+            self._live = live
+            try:
+                while self.current_screen == 'game' and self.running:
+                    # Sleep until a state change fires the event; the timeout
+                    # keeps a 1 Hz liveness floor
+                    if self._need_render.wait(timeout=1.0):
+                        self._need_render.clear()
+                        live.update(self.render_game_view())
+            finally:
+                self._live = None
 
     def run(self):
         """Main client loop"""
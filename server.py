@@ -4,13 +4,29 @@ CLI Omok Game Server
 Handles multiple clients, room management, and game logic
 """
 
+import base64
+import heapq
+import selectors
 import socket
-import threading
+import struct
 import json
 import sys
 import time
 from typing import Dict, List, Optional, Tuple
 
+# Serialize with orjson where available: C-implemented, takes/returns bytes
+# so the framing layer never round-trips through str. Stdlib fallback.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
 # Load configuration
 try:
     with open('config.json', 'r', encoding='utf-8') as f:
@@ -23,68 +39,129 @@ BOARD_SIZE = config['game']['board_size']
 HOST = config['server']['host']
 PORT = config['server']['port']
 
+# Wire format: 4-byte big-endian length prefix, then one JSON payload
+_FRAME_HEADER = struct.Struct('>I')
+FRAME_HEADER_SIZE = _FRAME_HEADER.size
+
+# No legitimate client message comes close to this; a larger declared
+# length is a corrupt or hostile frame and must not drive buffer growth
+MAX_FRAME_SIZE = 4096
+
+# Colors are small ints internally (turn switching is a XOR, comparisons
+# are int equality); the strings appear only at the protocol boundary
+BLACK = 0
+WHITE = 1
+_COLOR_NAMES = ('black', 'white')
+
+
+# Precomputed win-check shifts (s, 2s, 3s, 4s, 5s) per direction —
+# horizontal, vertical, diagonal \, diagonal / on the padded board
+_WIN_SHIFTS = tuple(
+    (s, 2 * s, 3 * s, 4 * s, 5 * s)
+    for s in (1, BOARD_SIZE + 1, BOARD_SIZE + 2, BOARD_SIZE)
+)
+
+
+def _has_five(bb: int) -> bool:
+    """Check if a bitboard contains a win (exactly 5 in a row)
+
+    Branchless SWAR check: ANDing the board with itself shifted by
+    1..4 strides leaves a bit set at the start of every 5-long run.
+    The padding column guarantees a run can never span two rows.
+    Module-level on plain ints, so the per-move call does no instance
+    attribute walking — the shifts and the function bind as globals.
+    """
+    for s1, s2, s3, s4, s5 in _WIN_SHIFTS:
+        run5 = bb & (bb >> s1) & (bb >> s2) & (bb >> s3) & (bb >> s4)
+
+        # Exactly 5 (not more, to handle 6-stone rule later if needed):
+        # reject windows with a same-color stone just before or after
+        if run5 & ~(bb << s1) & ~(bb >> s5):
+            return True
+
+    return False
+
 
 class Room:
     """Represents a game room with two players and game state"""
 
-    def __init__(self, room_id: str, room_name: str, creator_id: str, creator_nickname: str):
+    # Board geometry is fixed by config at import time — class attributes
+    # instead of per-instance copies, read as self.N / self.W (LOAD_ATTR
+    # rather than LOAD_GLOBAL in the hot move/validation paths)
+    N = BOARD_SIZE
+    W = BOARD_SIZE + 1  # bitboard row width incl. the padding column
+
+    def __init__(self, room_id: int, room_name: str, creator_id: int, creator_nickname: str):
         self.room_id = room_id
         self.name = room_name
-        self.players: List[Dict] = []
-        self.board = [[0 for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-        self.current_turn = 'black'  # black starts first
+        # Fixed two-player slots indexed by color, plus the reverse map —
+        # color and nickname lookups are O(1) instead of a list scan
+        self.players_by_color: List[Optional[Dict]] = [None, None]
+        self.client_to_color: Dict[int, int] = {}
+        # Flat row-major board: one contiguous byte per cell, indexed y*N+x
+        # (kept for display/broadcast; win detection uses the bitboards)
+        self.board = bytearray(self.N * self.N)
+
+        # One bitboard per color, laid out with a padding column (width W,
+        # bit index y*W+x) so a shifted window can never wrap across rows
+        self.black_bb = 0
+        self.white_bb = 0
+        self.current_turn = BLACK  # black starts first
         self.game_started = False
         self.game_over = False
         self.winner = None
 
+        # Cached to_dict result; dropped whenever membership/status changes
+        self._dict_cache: Optional[Dict] = None
+
         # Add creator as first player (black)
         self.add_player(creator_id, creator_nickname)
 
-    def add_player(self, client_id: str, nickname: str) -> bool:
+    def add_player(self, client_id: int, nickname: str) -> bool:
         """Add a player to the room. Returns True if successful."""
-        if len(self.players) >= 2:
+        if len(self.client_to_color) >= 2:
             return False
 
-        color = 'black' if len(self.players) == 0 else 'white'
-        self.players.append({
+        color = BLACK if self.players_by_color[BLACK] is None else WHITE
+        self.players_by_color[color] = {
             'client_id': client_id,
-            'nickname': nickname,
-            'color': color
-        })
+            'nickname': nickname
+        }
+        self.client_to_color[client_id] = color
 
         # Start game when 2 players joined
-        if len(self.players) == 2:
+        if len(self.client_to_color) == 2:
             self.game_started = True
 
+        self._dict_cache = None
         return True
 
-    def remove_player(self, client_id: str):
+    def remove_player(self, client_id: int):
         """Remove a player from the room"""
-        self.players = [p for p in self.players if p['client_id'] != client_id]
-        if len(self.players) < 2:
+        color = self.client_to_color.pop(client_id, None)
+        if color is not None:
+            self.players_by_color[color] = None
+        if len(self.client_to_color) < 2:
             self.game_started = False
+        self._dict_cache = None
 
-    def get_player_color(self, client_id: str) -> Optional[str]:
+    def get_player_color(self, client_id: int) -> Optional[int]:
         """Get the color of a player by client_id"""
-        for player in self.players:
-            if player['client_id'] == client_id:
-                return player['color']
-        return None
+        return self.client_to_color.get(client_id)
 
-    def get_player_nickname(self, color: str) -> Optional[str]:
+    def get_player_nickname(self, color: int) -> Optional[str]:
         """Get nickname by color"""
-        for player in self.players:
-            if player['color'] == color:
-                return player['nickname']
-        return None
+        player = self.players_by_color[color]
+        return player['nickname'] if player else None
 
     def is_valid_move(self, x: int, y: int) -> bool:
         """Check if a move is valid"""
-        if x < 0 or x >= BOARD_SIZE or y < 0 or y >= BOARD_SIZE:
+        N = self.N
+        if x < 0 or x >= N or y < 0 or y >= N:
             return False
-        return self.board[y][x] == 0
+        return self.board[y * N + x] == 0
 
-    def make_move(self, x: int, y: int, color: str) -> bool:
+    def make_move(self, x: int, y: int, color: int) -> bool:
         """Make a move. Returns True if successful."""
         if not self.is_valid_move(x, y):
             return False
@@ -93,57 +170,30 @@ class Room:
             return False
 
         # Place stone (1 for black, 2 for white)
-        stone_value = 1 if color == 'black' else 2
-        self.board[y][x] = stone_value
+        self.board[y * self.N + x] = color + 1
+
+        bit = 1 << (y * self.W + x)
+        if color == BLACK:
+            self.black_bb |= bit
+            bb = self.black_bb
+        else:
+            self.white_bb |= bit
+            bb = self.white_bb
 
         # Check for winner
-        if self.check_winner(x, y, stone_value):
+        if _has_five(bb):
             self.game_over = True
             self.winner = color
+            self._dict_cache = None
         else:
             # Switch turn
-            self.current_turn = 'white' if self.current_turn == 'black' else 'black'
+            self.current_turn ^= 1
 
         return True
 
-    def check_winner(self, x: int, y: int, stone: int) -> bool:
-        """Check if the last move resulted in a win (exactly 5 in a row)"""
-        directions = [
-            (1, 0),   # horizontal
-            (0, 1),   # vertical
-            (1, 1),   # diagonal \
-            (1, -1)   # diagonal /
-        ]
-
-        for dx, dy in directions:
-            count = 1  # count the stone we just placed
-
-            # Count in positive direction
-            count += self._count_direction(x, y, dx, dy, stone)
-
-            # Count in negative direction
-            count += self._count_direction(x, y, -dx, -dy, stone)
-
-            # Win if exactly 5 (not more, to handle 6-stone rule later if needed)
-            if count == 5:
-                return True
-
-        return False
-
-    def _count_direction(self, x: int, y: int, dx: int, dy: int, stone: int) -> int:
-        """Count consecutive stones in a direction"""
-        count = 0
-        nx, ny = x + dx, y + dy
-
-        while 0 <= nx < BOARD_SIZE and 0 <= ny < BOARD_SIZE:
-            if self.board[ny][nx] == stone:
-                count += 1
-                nx += dx
-                ny += dy
-            else:
-                break
-
-        return count
+    def check_winner(self, bb: int) -> bool:
+        """Check if a bitboard contains a win (see _has_five)"""
+        return _has_five(bb)
 
     def get_status(self) -> str:
         """Get room status"""
@@ -155,128 +205,222 @@ class Room:
             return 'waiting'
 
     def to_dict(self) -> Dict:
-        """Convert room info to dictionary"""
-        return {
-            'id': self.room_id,
-            'name': self.name,
-            'players': len(self.players),
-            'status': self.get_status()
-        }
+        """Convert room info to dictionary (cached until the room changes)"""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'id': self.room_id,
+                'name': self.name,
+                'players': len(self.client_to_color),
+                'status': self.get_status()
+            }
+        return self._dict_cache
 
 
 class GameServer:
-    """Main game server handling connections and rooms"""
+    """Main game server handling connections and rooms
+
+    All connections are serviced by a single selectors-based event loop:
+    each client socket is registered nonblocking and read events are
+    dispatched inline, so an idle client costs no thread and no stack.
+
+    Because only the event-loop thread ever touches self.rooms and
+    self.clients, no locking is needed anywhere — keep it that way when
+    adding handlers.
+    """
 
     def __init__(self, host: str, port: int):
         self.host = host
         self.port = port
-        self.rooms: Dict[str, Room] = {}
-        self.clients: Dict[str, Dict] = {}  # client_id -> {socket, nickname, room_id}
-        self.next_room_id = 1
-        self.next_client_id = 1
-        self.lock = threading.Lock()
+        # Slot arrays indexed by small int ids; freed slots hold None and
+        # their ids are recycled via the freelists, so every lookup is
+        # plain list indexing — no string formatting or hashing per access
+        self.rooms: List[Optional[Room]] = []
+        self.clients: List[Optional[Dict]] = []  # id -> {socket, nickname, room_id, rbuf, wbuf}
+        self._free_room_ids: List[int] = []
+        self._free_client_ids: List[int] = []
         self.server_socket = None
+        self.sel = selectors.DefaultSelector()
+
+        # Pending room deletions as a (expiry, room_id) heap, checked by
+        # the event loop — no thread per deletion
+        self._deletions: List[Tuple[float, int]] = []
+
+        # Pre-framed room_list reply, rebuilt lazily after any change to
+        # the room set or a room's player count / status — lobby polls
+        # between changes are a single buffered send with no serialization
+        self._room_list_cached: Optional[bytes] = None
 
     def start(self):
-        """Start the server"""
+        """Start the server (runs the event loop until interrupted)"""
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
         try:
             self.server_socket.bind((self.host, self.port))
             self.server_socket.listen(5)
+            self.server_socket.setblocking(False)
+            # data=None marks the listening socket; clients carry their id
+            self.sel.register(self.server_socket, selectors.EVENT_READ, None)
             print(f"Server started on {self.host}:{self.port}")
             print("Waiting for connections...")
 
             while True:
-                client_socket, address = self.server_socket.accept()
-                print(f"New connection from {address}")
-
-                # Assign client ID
-                with self.lock:
-                    client_id = f"client_{self.next_client_id}"
-                    self.next_client_id += 1
-                    self.clients[client_id] = {
-                        'socket': client_socket,
-                        'nickname': None,
-                        'room_id': None,
-                        'address': address
-                    }
+                for key, mask in self.sel.select(timeout=1.0):
+                    if key.data is None:
+                        self.accept_client()
+                        continue
+                    if mask & selectors.EVENT_READ:
+                        self.read_client(key)
+                    if mask & selectors.EVENT_WRITE:
+                        self.flush_client(key.data)
 
-                # Handle client in separate thread
-                thread = threading.Thread(target=self.handle_client, args=(client_id,))
-                thread.daemon = True
-                thread.start()
+                self.reap_rooms()
 
         except KeyboardInterrupt:
             print("\nShutting down server...")
         except Exception as e:
             print(f"Server error: {e}")
         finally:
+            self.sel.close()
             if self.server_socket:
                 self.server_socket.close()
 
-    def handle_client(self, client_id: str):
-        """Handle messages from a client"""
-        client_socket = self.clients[client_id]['socket']
+    def accept_client(self):
+        """Accept a new connection and register it with the selector"""
+        client_socket, address = self.server_socket.accept()
+        print(f"New connection from {address}")
+        client_socket.setblocking(False)
+        # Moves are latency-sensitive and tiny — don't let Nagle hold
+        # them; bursts are coalesced by joining frames before the send
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        if self._free_client_ids:
+            client_id = self._free_client_ids.pop()
+        else:
+            client_id = len(self.clients)
+            self.clients.append(None)
+        self.clients[client_id] = {
+            'socket': client_socket,
+            'nickname': None,
+            'room_id': None,
+            'address': address,
+            # Persistent read buffer; 'rused' counts the valid bytes.
+            # recv_into refills it in place so steady-state reads never
+            # allocate a fresh bytes object
+            'rbuf': bytearray(16384),
+            'rused': 0,
+            'wbuf': bytearray()
+        }
+        self.sel.register(client_socket, selectors.EVENT_READ, client_id)
+
+    def read_client(self, key: selectors.SelectorKey):
+        """Read into the client's persistent buffer and dispatch complete frames"""
+        client_id = key.data
+        client_socket = key.fileobj
+        client = self.clients[client_id]
+        # An earlier key in this select batch may have disconnected this
+        # client (freeing — and possibly recycling — its slot); the socket
+        # check also keeps a recycled id from aliasing a new client
+        if not client or client['socket'] is not client_socket:
+            return
+        rbuf = client['rbuf']
+        used = client['rused']
 
-        try:
-            while True:
-                # Receive message
-                data = client_socket.recv(4096)
-                if not data:
-                    break
-
-                try:
-                    message = json.loads(data.decode('utf-8'))
-                    msg_type = message.get('type')
-                    msg_data = message.get('data', {})
-
-                    # Handle different message types
-                    if msg_type == 'set_nickname':
-                        self.handle_set_nickname(client_id, msg_data)
-                    elif msg_type == 'create_room':
-                        self.handle_create_room(client_id, msg_data)
-                    elif msg_type == 'list_rooms':
-                        self.handle_list_rooms(client_id)
-                    elif msg_type == 'join_room':
-                        self.handle_join_room(client_id, msg_data)
-                    elif msg_type == 'move':
-                        self.handle_move(client_id, msg_data)
-                    elif msg_type == 'surrender':
-                        self.handle_surrender(client_id)
-                    elif msg_type == 'leave_room':
-                        self.handle_leave_room(client_id)
-                    else:
-                        self.send_error(client_id, f"Unknown message type: {msg_type}")
-
-                except json.JSONDecodeError:
-                    self.send_error(client_id, "Invalid JSON format")
-                except Exception as e:
-                    print(f"Error handling message from {client_id}: {e}")
-                    self.send_error(client_id, str(e))
+        # Double the buffer when full so frames larger than it still fit
+        if used == len(rbuf):
+            rbuf.extend(bytes(len(rbuf)))
 
-        except Exception as e:
+        try:
+            n = client_socket.recv_into(memoryview(rbuf)[used:])
+        except BlockingIOError:
+            return
+        except OSError as e:
             print(f"Client {client_id} connection error: {e}")
-        finally:
             self.disconnect_client(client_id)
+            return
+
+        if n == 0:
+            self.disconnect_client(client_id)
+            return
+        used += n
+
+        # Parse complete frames in place: 4-byte length prefix + payload
+        pos = 0
+        while used - pos >= FRAME_HEADER_SIZE:
+            size = _FRAME_HEADER.unpack_from(rbuf, pos)[0]
+            if size > MAX_FRAME_SIZE:
+                print(f"Client {client_id} sent oversized frame ({size} bytes)")
+                self.disconnect_client(client_id)
+                return
+            end = pos + FRAME_HEADER_SIZE + size
+            if end > used:
+                break
+            payload = bytes(rbuf[pos + FRAME_HEADER_SIZE:end])
+            pos = end
+            self.dispatch_message(client_id, payload)
+            # A handler may have disconnected (and freed) this client
+            if self.clients[client_id] is not client:
+                return
+
+        # Shift any partial frame to the front; the buffer itself is kept
+        if pos:
+            if pos < used:
+                rbuf[:used - pos] = rbuf[pos:used]
+            used -= pos
+        client['rused'] = used
 
-    def handle_set_nickname(self, client_id: str, data: Dict):
+    def dispatch_message(self, client_id: int, payload: bytes):
+        """Decode one framed message and route it to its handler"""
+        try:
+            message = json_loads(payload)
+        except ValueError:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
+            self.send_error(client_id, "Invalid JSON format")
+            return
+
+        try:
+            msg_type = message.get('type')
+            msg_data = message.get('data', {})
+
+            # Handle different message types
+            if msg_type == 'set_nickname':
+                self.handle_set_nickname(client_id, msg_data)
+            elif msg_type == 'create_room':
+                self.handle_create_room(client_id, msg_data)
+            elif msg_type == 'list_rooms':
+                self.handle_list_rooms(client_id)
+            elif msg_type == 'join_room':
+                self.handle_join_room(client_id, msg_data)
+            elif msg_type == 'move':
+                self.handle_move(client_id, msg_data)
+            elif msg_type == 'request_full_state':
+                self.handle_request_full_state(client_id)
+            elif msg_type == 'surrender':
+                self.handle_surrender(client_id)
+            elif msg_type == 'leave_room':
+                self.handle_leave_room(client_id)
+            else:
+                self.send_error(client_id, f"Unknown message type: {msg_type}")
+
+        except Exception as e:
+            print(f"Error handling message from {client_id}: {e}")
+            self.send_error(client_id, str(e))
+
+    def handle_set_nickname(self, client_id: int, data: Dict):
         """Handle nickname setting"""
         nickname = data.get('nickname', '').strip()
         if not nickname:
             self.send_error(client_id, "Nickname cannot be empty")
             return
 
-        with self.lock:
-            self.clients[client_id]['nickname'] = nickname
+        self.clients[client_id]['nickname'] = nickname
 
         self.send_message(client_id, {
             'type': 'nickname_set',
             'data': {'success': True, 'nickname': nickname}
         })
 
-    def handle_create_room(self, client_id: str, data: Dict):
+    def handle_create_room(self, client_id: int, data: Dict):
         """Handle room creation"""
         room_name = data.get('room_name', '').strip()
         if not room_name:
@@ -288,14 +432,17 @@ class GameServer:
             self.send_error(client_id, "Please set nickname first")
             return
 
-        with self.lock:
-            room_id = f"room_{self.next_room_id}"
-            self.next_room_id += 1
+        if self._free_room_ids:
+            room_id = self._free_room_ids.pop()
+        else:
+            room_id = len(self.rooms)
+            self.rooms.append(None)
 
-            # Create room
-            room = Room(room_id, room_name, client_id, nickname)
-            self.rooms[room_id] = room
-            self.clients[client_id]['room_id'] = room_id
+        # Create room
+        room = Room(room_id, room_name, client_id, nickname)
+        self.rooms[room_id] = room
+        self.clients[client_id]['room_id'] = room_id
+        self._room_list_cached = None
 
         # Send confirmation
         self.send_message(client_id, {
@@ -309,26 +456,26 @@ class GameServer:
             'data': {
                 'room_id': room_id,
                 'room_name': room_name,
-                'your_color': 'black'
+                'your_color': _COLOR_NAMES[BLACK]
             }
         })
 
         print(f"Room '{room_name}' created by {nickname}")
 
-    def handle_list_rooms(self, client_id: str):
-        """Handle room list request"""
-        with self.lock:
-            room_list = [room.to_dict() for room in self.rooms.values()]
+    def handle_list_rooms(self, client_id: int):
+        """Handle room list request (reply bytes cached between changes)"""
+        if self._room_list_cached is None:
+            self._room_list_cached = self._frame({
+                'type': 'room_list',
+                'data': {'rooms': [room.to_dict() for room in self.rooms if room]}
+            })
 
-        self.send_message(client_id, {
-            'type': 'room_list',
-            'data': {'rooms': room_list}
-        })
+        self._send_raw(client_id, self._room_list_cached)
 
-    def handle_join_room(self, client_id: str, data: Dict):
+    def handle_join_room(self, client_id: int, data: Dict):
         """Handle room join request"""
         room_id = data.get('room_id')
-        if not room_id:
+        if room_id is None:
             self.send_error(client_id, "Room ID is required")
             return
 
@@ -337,59 +484,65 @@ class GameServer:
             self.send_error(client_id, "Please set nickname first")
             return
 
-        with self.lock:
-            room = self.rooms.get(room_id)
-            if not room:
-                self.send_error(client_id, "Room not found")
-                return
+        room = self._get_room(room_id)
+        if not room:
+            self.send_error(client_id, "Room not found")
+            return
 
-            if len(room.players) >= 2:
-                self.send_error(client_id, "Room is full")
-                return
+        if len(room.client_to_color) >= 2:
+            self.send_error(client_id, "Room is full")
+            return
 
-            # Add player to room
-            if room.add_player(client_id, nickname):
-                self.clients[client_id]['room_id'] = room_id
-                player_color = room.get_player_color(client_id)
+        # Add player to room
+        if room.add_player(client_id, nickname):
+            self.clients[client_id]['room_id'] = room_id
+            self._room_list_cached = None
+            player_color = room.get_player_color(client_id)
 
-                # Send join confirmation
-                self.send_message(client_id, {
-                    'type': 'room_joined',
-                    'data': {
-                        'room_id': room_id,
-                        'room_name': room.name,
-                        'your_color': player_color
-                    }
-                })
+            # Send join confirmation
+            self.send_message(client_id, {
+                'type': 'room_joined',
+                'data': {
+                    'room_id': room_id,
+                    'room_name': room.name,
+                    'your_color': _COLOR_NAMES[player_color]
+                }
+            })
 
-                # If game started (2 players), notify both
-                if room.game_started:
-                    black_nick = room.get_player_nickname('black')
-                    white_nick = room.get_player_nickname('white')
+            # If game started (2 players), notify both
+            if room.game_started:
+                black_nick = room.get_player_nickname(BLACK)
+                white_nick = room.get_player_nickname(WHITE)
 
-                    self.broadcast_to_room(room_id, {
+                # The board is empty by definition at game start, so the
+                # initial state carries only whose turn it is; clients
+                # that need the real board pull it via request_full_state
+                self.broadcast_many(room_id, [
+                    {
                         'type': 'game_started',
                         'data': {
                             'black_player': black_nick,
                             'white_player': white_nick
                         }
-                    })
-
-                    # Send initial game state
-                    self.broadcast_game_state(room_id)
-
-                print(f"{nickname} joined room '{room.name}'")
-            else:
-                self.send_error(client_id, "Failed to join room")
+                    },
+                    {
+                        'type': 'game_start_state',
+                        'data': {'current_turn': _COLOR_NAMES[room.current_turn]}
+                    },
+                ])
+
+            print(f"{nickname} joined room '{room.name}'")
+        else:
+            self.send_error(client_id, "Failed to join room")
 
-    def handle_move(self, client_id: str, data: Dict):
+    def handle_move(self, client_id: int, data: Dict):
         """Handle move request"""
         room_id = self.clients[client_id].get('room_id')
-        if not room_id:
+        if room_id is None:
             self.send_error(client_id, "You are not in a room")
             return
 
-        room = self.rooms.get(room_id)
+        room = self.rooms[room_id]
         if not room or not room.game_started:
             self.send_error(client_id, "Game has not started")
             return
@@ -411,31 +564,37 @@ class GameServer:
 
         # Attempt move
         if room.make_move(x, y, player_color):
-            # Broadcast move result
-            self.broadcast_to_room(room_id, {
-                'type': 'move_result',
-                'data': {
-                    'success': True,
-                    'x': x,
-                    'y': y,
-                    'color': player_color
-                }
-            })
-
-            # Send updated game state
-            self.broadcast_game_state(room_id)
+            # Only one cell changed — ship the delta instead of the full
+            # board. The full game_state is reserved for the join path.
+            messages = [
+                {
+                    'type': 'move_result',
+                    'data': {
+                        'success': True,
+                        'x': x,
+                        'y': y,
+                        'color': _COLOR_NAMES[player_color],
+                        'current_turn': _COLOR_NAMES[room.current_turn]
+                    }
+                },
+            ]
 
             # Check if game over
             if room.game_over:
                 winner_nick = room.get_player_nickname(room.winner)
-                self.broadcast_to_room(room_id, {
+                messages.append({
                     'type': 'game_over',
                     'data': {
-                        'winner': room.winner,
+                        'winner': _COLOR_NAMES[room.winner],
                         'winner_nickname': winner_nick,
                         'reason': 'five_in_row'
                     }
                 })
+
+            self.broadcast_many(room_id, messages)
+
+            if room.game_over:
+                self._room_list_cached = None
                 print(f"Game over in room '{room.name}': {winner_nick} wins!")
 
                 # Schedule room deletion after 10 seconds
@@ -443,27 +602,45 @@ class GameServer:
         else:
             self.send_error(client_id, "Invalid move")
 
-    def handle_surrender(self, client_id: str):
+    def handle_request_full_state(self, client_id: int):
+        """Send the full board to a client that needs to resync"""
+        room_id = self.clients[client_id].get('room_id')
+        if room_id is None:
+            self.send_error(client_id, "You are not in a room")
+            return
+
+        room = self.rooms[room_id]
+        if not room:
+            self.send_error(client_id, "Room not found")
+            return
+
+        self.send_message(client_id, self.game_state_message(room))
+
+    def handle_surrender(self, client_id: int):
         """Handle surrender request"""
         room_id = self.clients[client_id].get('room_id')
-        if not room_id:
+        if room_id is None:
             return
 
-        room = self.rooms.get(room_id)
+        room = self.rooms[room_id]
         if not room or not room.game_started:
             return
 
         player_color = room.get_player_color(client_id)
-        winner_color = 'white' if player_color == 'black' else 'black'
+        if player_color is None:
+            return
+        winner_color = player_color ^ 1
         winner_nick = room.get_player_nickname(winner_color)
 
         room.game_over = True
         room.winner = winner_color
+        room._dict_cache = None
+        self._room_list_cached = None
 
         self.broadcast_to_room(room_id, {
             'type': 'game_over',
             'data': {
-                'winner': winner_color,
+                'winner': _COLOR_NAMES[winner_color],
                 'winner_nickname': winner_nick,
                 'reason': 'surrender'
             }
@@ -474,129 +651,219 @@ class GameServer:
         # Schedule room deletion after 10 seconds
         self.schedule_room_deletion(room_id, 10)
 
-    def handle_leave_room(self, client_id: str):
+    def handle_leave_room(self, client_id: int):
         """Handle player leaving a room"""
-        with self.lock:
-            client = self.clients.get(client_id)
-            if not client:
-                return
+        client = self.clients[client_id]
+        if not client:
+            return
 
-            room_id = client.get('room_id')
-            if not room_id:
-                return
+        room_id = client.get('room_id')
+        if room_id is None:
+            return
 
-            room = self.rooms.get(room_id)
-            if not room:
-                return
+        room = self.rooms[room_id]
+        if not room:
+            return
 
-            # Remove player from room
-            room.remove_player(client_id)
-            client['room_id'] = None
+        # Remove player from room
+        room.remove_player(client_id)
+        client['room_id'] = None
+        self._room_list_cached = None
 
-            # Notify other players
-            if len(room.players) > 0:
-                self.broadcast_to_room(room_id, {
-                    'type': 'player_left',
-                    'data': {'message': f"{client['nickname']} has left the room"}
-                })
-            else:
-                # Remove empty room
-                del self.rooms[room_id]
-                print(f"Room '{room.name}' removed (player left)")
+        # Notify other players
+        if room.client_to_color:
+            self.broadcast_to_room(room_id, {
+                'type': 'player_left',
+                'data': {'message': f"{client['nickname']} has left the room"}
+            })
+        else:
+            # Remove empty room
+            self._delete_room(room_id)
+            print(f"Room '{room.name}' removed (player left)")
+
+    def game_state_message(self, room: Room) -> Dict:
+        """Build the full game_state message for a room"""
+        # The board travels as base64 of the raw N*N bytes — one memcpy
+        # instead of serializing 225 ints into nested lists
+        return {
+            'type': 'game_state',
+            'data': {
+                'board_b64': base64.b64encode(bytes(room.board)).decode('ascii'),
+                'current_turn': _COLOR_NAMES[room.current_turn],
+                'black_player': room.get_player_nickname(BLACK),
+                'white_player': room.get_player_nickname(WHITE)
+            }
+        }
 
-    def broadcast_game_state(self, room_id: str):
+    def broadcast_game_state(self, room_id: int):
         """Broadcast current game state to all players in room"""
-        room = self.rooms.get(room_id)
+        room = self.rooms[room_id]
         if not room:
             return
 
-        self.broadcast_to_room(room_id, {
-            'type': 'game_state',
-            'data': {
-                'board': room.board,
-                'current_turn': room.current_turn,
-                'black_player': room.get_player_nickname('black'),
-                'white_player': room.get_player_nickname('white')
-            }
-        })
+        self.broadcast_to_room(room_id, self.game_state_message(room))
 
-    def broadcast_to_room(self, room_id: str, message: Dict):
-        """Send message to all clients in a room"""
-        room = self.rooms.get(room_id)
+    def broadcast_to_room(self, room_id: int, message: Dict):
+        """Send a message to all clients in a room (serialized once)"""
+        room = self.rooms[room_id]
         if not room:
             return
 
-        for player in room.players:
-            self.send_message(player['client_id'], message)
+        data = self._frame(message)
+        for player in room.players_by_color:
+            if player:
+                self._send_raw(player['client_id'], data)
 
-    def send_message(self, client_id: str, message: Dict):
-        """Send JSON message to a client"""
+    def broadcast_many(self, room_id: int, messages: List[Dict]):
+        """Send several messages to a room as a single write per client"""
+        room = self.rooms[room_id]
+        if not room:
+            return
+
+        data = b''.join(self._frame(m) for m in messages)
+        for player in room.players_by_color:
+            if player:
+                self._send_raw(player['client_id'], data)
+
+    @staticmethod
+    def _frame(message: Dict) -> bytes:
+        """Serialize a message into one length-prefixed frame"""
+        payload = json_dumps(message)
+        return _FRAME_HEADER.pack(len(payload)) + payload
+
+    def _send_raw(self, client_id: int, data: bytes):
+        """Queue pre-framed bytes for a client and flush what the socket accepts
+
+        Sends never block the event loop: whatever the kernel won't take
+        right now stays in the client's write buffer and is drained when
+        the selector reports the socket writable again. A stalled client
+        therefore can't hold up the rest of its room.
+        """
+        client = self.clients[client_id]
+        if not client or not client['socket']:
+            return
+
+        client['wbuf'] += data
+        self.flush_client(client_id)
+
+    def flush_client(self, client_id: int):
+        """Drain as much of a client's write buffer as the socket accepts"""
+        client = self.clients[client_id]
+        if not client:
+            return
+
+        sock = client['socket']
+        wbuf = client['wbuf']
         try:
-            client = self.clients.get(client_id)
-            if client and client['socket']:
-                # Add newline delimiter to separate multiple messages
-                data = (json.dumps(message) + '\n').encode('utf-8')
-                client['socket'].sendall(data)
-        except Exception as e:
+            while wbuf:
+                n = sock.send(wbuf)
+                del wbuf[:n]
+        except BlockingIOError:
+            pass
+        except OSError as e:
             print(f"Error sending message to {client_id}: {e}")
+            self.disconnect_client(client_id)
+            return
 
-    def send_error(self, client_id: str, error_message: str):
+        # Watch writability only while bytes remain buffered
+        events = selectors.EVENT_READ
+        if wbuf:
+            events |= selectors.EVENT_WRITE
+        try:
+            self.sel.modify(sock, events, client_id)
+        except (KeyError, ValueError):
+            pass
+
+    def send_message(self, client_id: int, message: Dict):
+        """Send JSON message to a client"""
+        self._send_raw(client_id, self._frame(message))
+
+    def send_error(self, client_id: int, error_message: str):
         """Send error message to client"""
         self.send_message(client_id, {
             'type': 'error',
             'data': {'message': error_message}
         })
 
-    def schedule_room_deletion(self, room_id: str, delay: int):
+    def _get_room(self, room_id) -> Optional[Room]:
+        """Room lookup tolerant of arbitrary client-supplied ids"""
+        if isinstance(room_id, int) and 0 <= room_id < len(self.rooms):
+            return self.rooms[room_id]
+        return None
+
+    def _delete_room(self, room_id: int):
+        """Free a room slot and recycle its id"""
+        room = self.rooms[room_id]
+        if room:
+            # Detach any remaining members: room ids are recycled, so a
+            # stale room_id would point their later leave or disconnect
+            # at whatever unrelated room reuses this slot
+            for player in room.players_by_color:
+                if player:
+                    client = self.clients[player['client_id']]
+                    if client and client.get('room_id') == room_id:
+                        client['room_id'] = None
+
+        self.rooms[room_id] = None
+        self._free_room_ids.append(room_id)
+        self._room_list_cached = None
+
+    def schedule_room_deletion(self, room_id: int, delay: int):
         """Schedule a room to be deleted after a delay (in seconds)"""
-        def delete_room():
-            time.sleep(delay)
-            with self.lock:
-                if room_id in self.rooms:
-                    room = self.rooms[room_id]
-                    del self.rooms[room_id]
-                    print(f"Room '{room.name}' automatically deleted after game ended")
-
-        # Run deletion in separate thread
-        deletion_thread = threading.Thread(target=delete_room)
-        deletion_thread.daemon = True
-        deletion_thread.start()
-
-    def disconnect_client(self, client_id: str):
+        heapq.heappush(self._deletions, (time.monotonic() + delay, room_id))
+
+    def reap_rooms(self):
+        """Delete rooms whose post-game grace period has expired"""
+        now = time.monotonic()
+        while self._deletions and self._deletions[0][0] <= now:
+            _, room_id = heapq.heappop(self._deletions)
+            # The slot may be empty or reused by a newer room by now —
+            # only reap a room that actually finished its game
+            room = self.rooms[room_id]
+            if room and room.game_over:
+                self._delete_room(room_id)
+                print(f"Room '{room.name}' automatically deleted after game ended")
+
+    def disconnect_client(self, client_id: int):
         """Handle client disconnection"""
-        with self.lock:
-            client = self.clients.get(client_id)
-            if not client:
-                return
+        client = self.clients[client_id]
+        if not client:
+            return
 
-            # Remove from room if in one
-            room_id = client.get('room_id')
-            if room_id:
-                room = self.rooms.get(room_id)
-                if room:
-                    room.remove_player(client_id)
-
-                    # Notify other players
-                    if len(room.players) > 0:
-                        self.broadcast_to_room(room_id, {
-                            'type': 'player_left',
-                            'data': {'message': f"{client['nickname']} has left the room"}
-                        })
-                    else:
-                        # Remove empty room
-                        del self.rooms[room_id]
-                        print(f"Room '{room.name}' removed (empty)")
-
-            # Close socket
-            try:
-                client['socket'].close()
-            except:
-                pass
-
-            # Remove client
-            nickname = client.get('nickname', 'Unknown')
-            del self.clients[client_id]
-            print(f"Client {client_id} ({nickname}) disconnected")
+        # Remove from room if in one
+        room_id = client.get('room_id')
+        if room_id is not None:
+            room = self.rooms[room_id]
+            if room:
+                room.remove_player(client_id)
+                self._room_list_cached = None
+
+                # Notify other players
+                if room.client_to_color:
+                    self.broadcast_to_room(room_id, {
+                        'type': 'player_left',
+                        'data': {'message': f"{client['nickname']} has left the room"}
+                    })
+                else:
+                    # Remove empty room
+                    self._delete_room(room_id)
+                    print(f"Room '{room.name}' removed (empty)")
+
+        # Unregister and close socket
+        try:
+            self.sel.unregister(client['socket'])
+        except (KeyError, ValueError):
+            pass
+        try:
+            client['socket'].close()
+        except:
+            pass
+
+        # Remove client: free the slot and recycle the id
+        nickname = client.get('nickname', 'Unknown')
+        self.clients[client_id] = None
+        self._free_client_ids.append(client_id)
+        print(f"Client {client_id} ({nickname}) disconnected")
 
 
 def main():